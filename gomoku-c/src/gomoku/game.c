@@ -747,6 +747,20 @@ int write_game_json(game_state_t *game, const char *filename) {
     return 0;
   }
 
+  // Winner (GAME_HUMAN_WIN = X won, GAME_AI_WIN = O won) and move count go
+  // first, so tools that only need the outcome can stop reading early
+  const char *winner_str = "none";
+  if (game->game_state == GAME_HUMAN_WIN) {
+    winner_str = "X";
+  } else if (game->game_state == GAME_AI_WIN) {
+    winner_str = "O";
+  } else if (game->game_state == GAME_DRAW) {
+    winner_str = "draw";
+  }
+  json_object_object_add(root, "winner", json_object_new_string(winner_str));
+  json_object_object_add(root, "move_count",
+                         json_object_new_int(game->move_history_count));
+
   // Player X configuration
   json_object *player_x = json_object_new_object();
   json_object_object_add(
@@ -792,17 +806,6 @@ int write_game_json(game_state_t *game, const char *filename) {
   json_object_object_add(
       root, "undo", json_object_new_boolean(game->config.enable_undo ? 1 : 0));
 
-  // Winner (GAME_HUMAN_WIN = X won, GAME_AI_WIN = O won)
-  const char *winner_str = "none";
-  if (game->game_state == GAME_HUMAN_WIN) {
-    winner_str = "X";
-  } else if (game->game_state == GAME_AI_WIN) {
-    winner_str = "O";
-  } else if (game->game_state == GAME_DRAW) {
-    winner_str = "draw";
-  }
-  json_object_object_add(root, "winner", json_object_new_string(winner_str));
-
   // Final board state as array of row strings (space-separated)
   json_object *board_array = json_object_new_array();
   const char *x_symbol = "✕";
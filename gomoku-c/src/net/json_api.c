@@ -385,6 +385,20 @@ char *json_api_serialize_game_ex(game_state_t *game,
     return NULL;
   }
 
+  // Winner and move count go first, so clients that only need the outcome
+  // can stop reading early
+  const char *winner_str = "none";
+  if (game->game_state == GAME_HUMAN_WIN) {
+    winner_str = "X";
+  } else if (game->game_state == GAME_AI_WIN) {
+    winner_str = "O";
+  } else if (game->game_state == GAME_DRAW) {
+    winner_str = "draw";
+  }
+  json_object_object_add(root, "winner", json_object_new_string(winner_str));
+  json_object_object_add(root, "move_count",
+                         json_object_new_int(game->move_history_count));
+
   // Player X configuration
   json_object *player_x = json_object_new_object();
   json_object_object_add(
@@ -431,17 +445,6 @@ char *json_api_serialize_game_ex(game_state_t *game,
   json_object_object_add(root, "undo_limit",
                          json_object_new_int(game->config.max_undo_allowed));
 
-  // Winner
-  const char *winner_str = "none";
-  if (game->game_state == GAME_HUMAN_WIN) {
-    winner_str = "X";
-  } else if (game->game_state == GAME_AI_WIN) {
-    winner_str = "O";
-  } else if (game->game_state == GAME_DRAW) {
-    winner_str = "draw";
-  }
-  json_object_object_add(root, "winner", json_object_new_string(winner_str));
-
   // Board state as array of row strings
   json_object *board_array = json_object_new_array();
   const char *x_symbol = "X"; // Use ASCII for API
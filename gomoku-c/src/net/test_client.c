@@ -310,11 +310,15 @@ static const char *get_winner(const char *json) {
   if (!winner)
     return "none";
 
-  if (strstr(winner, "\"X\""))
+  // Match the value itself; other keys (e.g. "X") follow in the document
+  winner++;
+  while (*winner == ' ' || *winner == '\t' || *winner == '\n')
+    winner++;
+  if (strncmp(winner, "\"X\"", 3) == 0)
     return "X";
-  if (strstr(winner, "\"O\""))
+  if (strncmp(winner, "\"O\"", 3) == 0)
     return "O";
-  if (strstr(winner, "\"draw\""))
+  if (strncmp(winner, "\"draw\"", 6) == 0)
     return "draw";
   return "none";
 }
@@ -545,30 +549,28 @@ static void timer_tick_fn(void *ctx) {
 //===============================================================================
 
 /**
- * Save game state to JSON file, injecting server_errors if any were recorded.
- * Inserts "server_errors": { "503": N, ... } before the closing brace.
+ * Whether -j names standard output ("-") rather than a file.
  */
-static int save_game_json(const char *filename, const char *json,
-                          const error_tracker_t *tracker) {
-  FILE *fp = fopen(filename, "w");
-  if (!fp) {
-    fprintf(stderr, "Error: Failed to open '%s' for writing: %s\n", filename,
-            strerror(errno));
-    return 0;
-  }
+static int json_to_stdout(const char *filename) {
+  return strcmp(filename, "-") == 0;
+}
 
+/**
+ * Write game state JSON to fp, injecting server_errors if any were recorded.
+ * Inserts "server_errors": { "503": N, ... } before the closing brace.
+ */
+static void emit_game_json(FILE *fp, const char *json,
+                           const error_tracker_t *tracker) {
   if (tracker->num_entries == 0) {
     fprintf(fp, "%s", json);
-    fclose(fp);
-    return 1;
+    return;
   }
 
   // Find the last '}' to inject server_errors before it
   const char *last_brace = strrchr(json, '}');
   if (!last_brace) {
     fprintf(fp, "%s", json);
-    fclose(fp);
-    return 1;
+    return;
   }
 
   // Write everything up to the last '}'
@@ -581,7 +583,26 @@ static int save_game_json(const char *filename, const char *json,
             tracker->entries[i].status_code, tracker->entries[i].count);
   }
   fprintf(fp, "\n  }\n}\n");
+}
 
+/**
+ * Save game state to a JSON file, or to stdout when filename is "-".
+ */
+static int save_game_json(const char *filename, const char *json,
+                          const error_tracker_t *tracker) {
+  if (json_to_stdout(filename)) {
+    emit_game_json(stdout, json, tracker);
+    fflush(stdout);
+    return 1;
+  }
+
+  FILE *fp = fopen(filename, "w");
+  if (!fp) {
+    fprintf(stderr, "Error: Failed to open '%s' for writing: %s\n", filename,
+            strerror(errno));
+    return 0;
+  }
+  emit_game_json(fp, json, tracker);
   fclose(fp);
   return 1;
 }
@@ -604,6 +625,7 @@ static void print_usage(const char *program) {
   printf("  -b, --board <n>       Board size 15 or 19 (default: 15)\n");
   printf("  -t, --timeout <n>     Move timeout in seconds (default: none)\n");
   printf("  -j, --json <file>     Save game to JSON file after every move\n");
+  printf("                        (\"-\" writes the final game to stdout)\n");
   printf("  -q, --quiet           No terminal output (for batch/tournament)\n");
   printf("  -v, --verbose         Show game state after each move\n");
   printf("  --help                Show this help message\n\n");
@@ -794,7 +816,10 @@ int main(int argc, char *argv[]) {
     return 1;
   }
 
-  sleep(2);
+  // Give a human time to read the banner; batch runs (-q) start right away so
+  // a tournament doesn't pay two idle seconds for every game it spawns.
+  if (!quiet)
+    sleep(2);
 
   int move_num = 0;
   const char *winner = "none";
@@ -882,8 +907,9 @@ int main(int argc, char *argv[]) {
     move_num++;
     winner = get_winner(game_state);
 
-    // Save game state after every move when -j is specified
-    if (json_file) {
+    // Save game state after every move when -j names a file; stdout only
+    // gets the final game, so a reader sees a single JSON document
+    if (json_file && !json_to_stdout(json_file)) {
       save_game_json(json_file, game_state, &errors);
     }
   }
@@ -913,7 +939,8 @@ int main(int argc, char *argv[]) {
       }
       printf(")\n");
     }
-    if (json_file && save_game_json(json_file, game_state, &errors)) {
+    if (json_file && save_game_json(json_file, game_state, &errors) &&
+        !json_to_stdout(json_file)) {
       printf("%*sGame saved to: %s\n", 3, "", json_file);
     }
   } else if (json_file) {
@@ -276,6 +276,32 @@ TEST_F(DaemonJsonTest, SerializeRoundTrip) {
   cleanup_game(game2);
 }
 
+// Test that winner and move_count are written before everything else
+TEST_F(DaemonJsonTest, SerializeWritesOutcomeFirst) {
+  std::string json = read_fixture("valid_game_start.json");
+  ASSERT_FALSE(json.empty()) << "Could not read fixture file";
+
+  char error[256] = {0};
+  game_state_t *game = json_api_parse_game(json.c_str(), error, sizeof(error));
+  ASSERT_NE(game, nullptr) << "Parse failed: " << error;
+
+  char *serialized = json_api_serialize_game(game);
+  ASSERT_NE(serialized, nullptr);
+  std::string out(serialized);
+
+  size_t winner = out.find("\"winner\"");
+  size_t move_count = out.find("\"move_count\":" +
+                               std::to_string(game->move_history_count));
+  ASSERT_NE(winner, std::string::npos);
+  ASSERT_NE(move_count, std::string::npos);
+  EXPECT_LT(winner, move_count);
+  EXPECT_LT(move_count, out.find("\"X\""));
+  EXPECT_LT(move_count, out.find("\"moves\""));
+
+  free(serialized);
+  cleanup_game(game);
+}
+
 // Test serializing null game
 TEST_F(DaemonJsonTest, SerializeNullGame) {
   char *result = json_api_serialize_game(nullptr);
@@ -6,14 +6,28 @@ Analyzes game transcripts using an LLM to assess move quality and identify blund
 
 Usage:
     python llm_eval.py --game saved.json [--api-key KEY] [--model MODEL]
+    python llm_eval.py --games-glob 'results/*.json' --batch-size 4 [--batch-api]
+    python llm_eval.py --games-dir results/ [--concurrency 10] [--qpm 50]
+    python llm_eval.py --game saved.json --stream
+
+Evaluations are cached in ~/.cache/gomoku-llm-eval, keyed by a hash of the
+provider, model and full prompt; pass --no-cache to always call the API.
 
 Requires:
     pip install anthropic  # or openai
+    pip install 'httpx[http2]'  # optional, enables HTTP/2 multiplexing
+    pip install orjson  # optional, faster game/cache JSON parsing
 """
 
 import argparse
+import asyncio
+import glob
+import hashlib
 import json
+import random
+import re
 import sys
+import time
 from pathlib import Path
 
 # Try to import API clients
@@ -29,6 +43,29 @@ try:
 except ImportError:
     HAS_OPENAI = False
 
+try:
+    import h2  # noqa: F401 - httpx only speaks HTTP/2 when h2 is installed
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Connection pool settings for the API clients. Connections are kept warm
+# between requests so a sweep pays the TLS handshake once, not per game.
+# Timeouts are left to the SDK defaults (5s connect, 600s read), since a
+# 4096-token evaluation can take minutes to generate.
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# Clients are created lazily and reused, keyed by (provider, api_key).
+_clients = {}
+
 
 EVALUATION_PROMPT = """You are an expert Gomoku (Five in a Row) analyst. Analyze the following game and evaluate each move.
 
@@ -89,121 +126,592 @@ Format your response as JSON:
 """
 
 
+BATCH_EVALUATION_PROMPT = """You are an expert Gomoku (Five in a Row) analyst. Analyze each of the following {count} games independently and evaluate each move.
+
+Game Rules:
+- Players alternate placing stones (X goes first, O second)
+- First to get 5 in a row (horizontal, vertical, or diagonal) wins
+- X typically has first-move advantage
+
+Board coordinates are [row, col] starting from [0,0] at top-left.
+
+{games}
+
+For every game provide an overall rating (1-10), a rating for each player,
+a 1-10 rating and short comment for every move, the 2-3 critical moments,
+any blunders (moves rated 1-3 that turned a winning/drawing position into a
+losing one), and suggestions for the losing side.
+
+Format your response as a JSON array with exactly {count} evaluations, in the
+same order as the games above:
+[
+    {{
+        "game": 1,
+        "overall_rating": 7,
+        "x_rating": 8,
+        "o_rating": 6,
+        "moves": [
+            {{"move": 1, "player": "X", "position": [9, 9], "rating": 9, "comment": "Standard center opening"}},
+            ...
+        ],
+        "critical_moments": [
+            {{"move": 15, "description": "X creates unstoppable double-three threat"}}
+        ],
+        "blunders": [
+            {{"move": 14, "player": "O", "position": [7, 6], "rating": 2, "explanation": "Blocked already-closed three instead of creating own threat"}}
+        ],
+        "suggestions": "O should have focused on creating own threats rather than passive defense"
+    }},
+    ...
+]
+"""
+
+# EVALUATION_PROMPT split once around its two placeholders, with the {{ }}
+# escapes already resolved, so each prompt is a plain concatenation.
+_P1, _rest = EVALUATION_PROMPT.split("{game_transcript}")
+_P2, _P3 = _rest.split("{winner}")
+_P1, _P2, _P3 = (part.replace("{{", "{").replace("}}", "}") for part in (_P1, _P2, _P3))
+del _rest
+
+# Appended to the prompt when streaming, so the response can be parsed as it
+# arrives instead of being fished out of a code fence at the end.
+STREAM_INSTRUCTION = "\n\nRespond with the JSON object only, with no surrounding prose or code fences."
+
+# Output budget per game in a combined request, and the ceiling for the whole
+# request (larger non-streaming requests are rejected by the Anthropic SDK).
+MAX_TOKENS_PER_GAME = 4096
+MAX_BATCH_TOKENS = 16384
+
+# Most games one combined request can cover while still giving each game the
+# full per-game budget; beyond this the JSON array gets cut off mid-game.
+MAX_BATCH_SIZE = MAX_BATCH_TOKENS // MAX_TOKENS_PER_GAME
+
+# How often to check on a Message Batches API job, and how long to wait for
+# it at most (the API expires unfinished requests after 24 hours).
+BATCH_POLL_INTERVAL = 10
+BATCH_TIMEOUT = 25 * 60 * 60
+
+# Requests in flight at once when evaluating many games one per request.
+DEFAULT_CONCURRENCY = 10
+
+# Backoff for requests rejected with HTTP 429 (or failing transiently: a
+# dropped connection, timeout, 408, 409 or 5xx including 529 overloaded):
+# exponential from 1s, capped at 30s, plus up to a second of jitter so retries
+# don't arrive in lockstep. A retry-after header from the server wins.
+RATE_LIMIT_ATTEMPTS = 6
+RATE_LIMIT_INITIAL_BACKOFF = 1.0
+RATE_LIMIT_MAX_BACKOFF = 30.0
+
+# Evaluations keyed by sha256(provider, model, prompt). The prompt embeds the
+# transcript and the full instructions, so editing either invalidates entries.
+# Results of combined --batch-size requests are stored under "<model>#batch",
+# keyed by the batch template and the game (see batch_cache_key).
+CACHE_DIR = Path.home() / '.cache' / 'gomoku-llm-eval'
+
+# Fenced code blocks in a response: one tagged "json" is preferred, then
+# the first fence of any kind.
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+_ANY_FENCE_RE = re.compile(r"```[^\n`]*\n?(.*?)```", re.DOTALL)
+
+# Transcripts already formatted in this process, keyed by id(game). The game
+# itself is kept alongside so its id can't be recycled by another object.
+_transcripts = {}
+
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
 def load_game(filepath: str) -> dict:
     """Load game JSON file."""
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return json_loads(f.read())
 
 
 def format_game_transcript(game: dict) -> str:
     """Format game data into readable transcript."""
-    lines = []
-    lines.append(f"Board Size: {game.get('board', game.get('board_size', 19))}x{game.get('board', game.get('board_size', 19))}")
-    lines.append(f"X Player: {game.get('X', {}).get('player', 'unknown')}")
-    lines.append(f"O Player: {game.get('O', {}).get('player', 'unknown')}")
-    lines.append("")
-    lines.append("Moves:")
+    cached = _transcripts.get(id(game))
+    if cached and cached[0] is game:
+        return cached[1]
+
+    board_size = game.get('board') or game.get('board_size') or 19
+    lines = [
+        f"Board Size: {board_size}x{board_size}",
+        f"X Player: {game.get('X', {}).get('player', 'unknown')}",
+        f"O Player: {game.get('O', {}).get('player', 'unknown')}",
+        "",
+        "Moves:",
+    ]
 
     for i, move in enumerate(game.get('moves', []), 1):
-        # Extract player and position from move object
-        player = None
-        position = None
-        for key, value in move.items():
-            if isinstance(value, list) and len(value) == 2:
-                player = 'X' if 'X' in key else 'O'
-                position = value
-                break
-
-        if player and position:
-            time_ms = move.get('time_ms', 0)
-            eval_count = move.get('moves_evaluated', move.get('moves_searched', 0))
-            score = move.get('score', '')
-
-            line = f"  {i}. {player} plays [{position[0]}, {position[1]}]"
-            if time_ms:
-                line += f" ({time_ms:.0f}ms)"
-            if eval_count:
-                line += f" [{eval_count} positions evaluated]"
-            if score:
-                line += f" (score: {score})"
-            lines.append(line)
-
-    return "\n".join(lines)
+        # The player key ("X", "O (AI)", ...) is always written first, so
+        # there's no need to scan the whole move object for it
+        key = next(iter(move), None)
+        if not key or key[0] not in ('X', 'O'):
+            continue
+        position = move[key]
+        if isinstance(position, list):
+            if len(position) != 2:
+                continue
+            position = f"[{position[0]}, {position[1]}]"
+        elif not isinstance(position, str):
+            continue
 
+        line = f"  {i}. {key[0]} plays {position}"
+        time_ms = move.get('time_ms')
+        if time_ms:
+            line += f" ({time_ms:.0f}ms)"
+        eval_count = move.get('moves_evaluated') or move.get('moves_searched')
+        if eval_count:
+            line += f" [{eval_count} positions evaluated]"
+        score = move.get('score')
+        if score:
+            line += f" (score: {score})"
+        lines.append(line)
 
-def evaluate_with_anthropic(game: dict, api_key: str, model: str = "claude-sonnet-4-20250514") -> dict:
-    """Evaluate game using Anthropic Claude."""
-    if not HAS_ANTHROPIC:
-        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+    transcript = "\n".join(lines)
+    _transcripts[id(game)] = (game, transcript)
+    return transcript
 
-    client = anthropic.Anthropic(api_key=api_key)
 
-    transcript = format_game_transcript(game)
-    winner = game.get('winner', 'unknown')
+def _make_prompt(transcript: str, winner: str) -> str:
+    """Fill the pre-split EVALUATION_PROMPT."""
+    return _P1 + transcript + _P2 + winner + _P3
 
-    prompt = EVALUATION_PROMPT.format(
-        game_transcript=transcript,
-        winner=winner
-    )
 
-    response = client.messages.create(
-        model=model,
-        max_tokens=4096,
-        messages=[{"role": "user", "content": prompt}]
-    )
+def build_prompt(game: dict) -> str:
+    """Build the single-game evaluation prompt."""
+    return _make_prompt(format_game_transcript(game), str(game.get('winner', 'unknown')))
+
+
+def format_game_section(game: dict) -> str:
+    """One game's part of a combined prompt, without its "GAME n:" header."""
+    return f"{format_game_transcript(game)}\n\nFINAL RESULT: {game.get('winner', 'unknown')}"
 
-    # Extract JSON from response
-    response_text = response.content[0].text
 
-    # Try to find JSON in response
+def build_batch_prompt(games: list) -> str:
+    """Build one prompt that asks for evaluations of several games at once."""
+    sections = [f"GAME {i}:\n{format_game_section(game)}" for i, game in enumerate(games, 1)]
+    return BATCH_EVALUATION_PROMPT.format(count=len(games), games="\n\n".join(sections))
+
+
+def cache_key(provider: str, model: str, prompt: str) -> str:
+    """Content hash identifying one evaluation request."""
+    return hashlib.sha256(f"{provider}\0{model}\0{prompt}".encode()).hexdigest()
+
+
+def batch_cache_key(provider: str, model: str, game: dict) -> str:
+    """Key for a game evaluated inside a combined request.
+
+    The combined prompt depends on which games share the request, so the key
+    covers the batch template and this game's own section only.
+    """
+    return cache_key(provider, f"{model}#batch", f"{BATCH_EVALUATION_PROMPT}\0{format_game_section(game)}")
+
+
+def cache_get(key: str):
+    """Return the cached evaluation for key, or None."""
     try:
-        # Look for JSON block
-        if "```json" in response_text:
-            json_str = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            json_str = response_text.split("```")[1].split("```")[0]
-        else:
-            json_str = response_text
+        with open(CACHE_DIR / f"{key}.json", 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(key: str, evaluation: dict):
+    """Store an evaluation; responses that failed to parse are not cached."""
+    if not isinstance(evaluation, dict) or evaluation.get("parse_error"):
+        return
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / f"{key}.json", 'wb') as f:
+        f.write(json_dumps(evaluation))
+
+
+def parse_json_response(response_text: str):
+    """Extract the JSON payload from an LLM response."""
+    # Bare JSON needs no fence search at all
+    if response_text.lstrip().startswith(('{', '[')):
+        json_str = response_text
+    else:
+        match = _JSON_FENCE_RE.search(response_text) or _ANY_FENCE_RE.search(response_text)
+        json_str = match.group(1) if match else response_text
 
+    try:
         return json.loads(json_str)
     except json.JSONDecodeError:
         return {"raw_response": response_text, "parse_error": True}
 
 
-def evaluate_with_openai(game: dict, api_key: str, model: str = "gpt-4") -> dict:
-    """Evaluate game using OpenAI GPT."""
+def http_client_options(sdk) -> dict:
+    """Pooling and HTTP/2 options for an SDK's own httpx client class.
+
+    Limits are built from the SDK's DEFAULT_CONNECTION_LIMITS type so they
+    match whichever httpx package that SDK release is built on.
+    """
+    limits = type(sdk.DEFAULT_CONNECTION_LIMITS)(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+    )
+    return {"http2": HAS_HTTP2, "limits": limits}
+
+
+def get_anthropic_client(api_key: str):
+    """Return the shared Anthropic client for this API key."""
+    if not HAS_ANTHROPIC:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+
+    key = ("anthropic", api_key)
+    if key not in _clients:
+        _clients[key] = anthropic.Anthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultHttpxClient(**http_client_options(anthropic))
+        )
+    return _clients[key]
+
+
+def get_openai_client(api_key: str):
+    """Return the shared OpenAI client for this API key."""
     if not HAS_OPENAI:
         raise ImportError("openai package not installed. Run: pip install openai")
 
-    client = openai.OpenAI(api_key=api_key)
+    key = ("openai", api_key)
+    if key not in _clients:
+        _clients[key] = openai.OpenAI(
+            api_key=api_key,
+            http_client=openai.DefaultHttpxClient(**http_client_options(openai))
+        )
+    return _clients[key]
+
+
+class MoveStreamParser:
+    """Collect completed move analyses from a streaming evaluation.
+
+    Scanner state (string/escape flags and the bracket stack) is kept between
+    feed() calls, so each character of the response is looked at once. A move
+    is parsed only when the '}' closing an element of the top-level "moves"
+    array arrives; everything else is left to the final parse.
+    """
+
+    def __init__(self):
+        self.moves = []
+        self._stack = []          # open brackets; 'm' marks the "moves" array
+        self._in_string = False
+        self._escaped = False
+        self._key = None          # characters of a root-level string being read
+        self._last_key = None     # last root-level string, i.e. the current key
+        self._move_parts = None   # text of the move object being read, by chunk
+
+    def feed(self, text: str) -> bool:
+        """Scan the next piece of the response; True if it completed a move."""
+        completed = False
+        move_start = 0
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._key is not None:
+                        self._last_key = "".join(self._key)
+                        self._key = None
+                    continue
+                if self._key is not None:
+                    self._key.append(ch)
+            elif ch == '"':
+                self._in_string = True
+                if len(self._stack) == 1:
+                    self._key = []
+            elif ch == "{":
+                if len(self._stack) == 2 and self._stack[-1] == "m":
+                    self._move_parts = []
+                    move_start = i
+                self._stack.append("{")
+            elif ch == "[":
+                in_root = len(self._stack) == 1
+                self._stack.append("m" if in_root and self._last_key == "moves" else "[")
+            elif ch in "}]" and self._stack:
+                self._stack.pop()
+                if ch == "}" and self._move_parts is not None and len(self._stack) == 2:
+                    self._move_parts.append(text[move_start:i + 1])
+                    try:
+                        self.moves.append(json.loads("".join(self._move_parts)))
+                        completed = True
+                    except json.JSONDecodeError:
+                        pass
+                    self._move_parts = None
+        if self._move_parts is not None:
+            self._move_parts.append(text[move_start:])
+        return completed
+
+
+def ask_anthropic(prompt: str, api_key: str, model: str, max_tokens: int = 4096) -> str:
+    """Send a prompt to Anthropic Claude and return the response text."""
+    client = get_anthropic_client(api_key)
 
-    transcript = format_game_transcript(game)
-    winner = game.get('winner', 'unknown')
-
-    prompt = EVALUATION_PROMPT.format(
-        game_transcript=transcript,
-        winner=winner
+    response = client.messages.create(
+        model=model,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}]
     )
 
+    return response.content[0].text
+
+
+def ask_openai(prompt: str, api_key: str, model: str, max_tokens: int = 4096) -> str:
+    """Send a prompt to OpenAI GPT and return the response text."""
+    client = get_openai_client(api_key)
+
     response = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
-        max_tokens=4096
+        max_tokens=max_tokens
     )
 
-    response_text = response.choices[0].message.content
+    return response.choices[0].message.content
+
+
+def evaluate_with_anthropic(game: dict, api_key: str, model: str = "claude-sonnet-4-20250514") -> dict:
+    """Evaluate game using Anthropic Claude."""
+    return parse_json_response(ask_anthropic(build_prompt(game), api_key, model))
+
+
+def stream_evaluation_with_anthropic(game: dict, api_key: str, model: str = "claude-sonnet-4-20250514",
+                                     use_cache: bool = True):
+    """Evaluate game using Anthropic Claude, streaming the response.
+
+    Yields {"moves": [...]} each time another move analysis completes; the
+    last value yielded is the full evaluation. A cached evaluation is
+    yielded once, without calling the API.
+    """
+    key = cache_key("anthropic", model, build_prompt(game)) if use_cache else None
+    cached = cache_get(key) if key else None
+    if cached is not None:
+        yield cached
+        return
+
+    client = get_anthropic_client(api_key)
+
+    chunks = []
+    parser = MoveStreamParser()
+    with client.messages.stream(
+        model=model,
+        max_tokens=MAX_TOKENS_PER_GAME,
+        messages=[{"role": "user", "content": build_prompt(game) + STREAM_INSTRUCTION}]
+    ) as stream:
+        for text in stream.text_stream:
+            chunks.append(text)
+            if parser.feed(text):
+                yield {"moves": parser.moves}
+
+    evaluation = parse_json_response("".join(chunks))
+    if key:
+        cache_put(key, evaluation)
+    yield evaluation
+
+
+def evaluate_with_openai(game: dict, api_key: str, model: str = "gpt-4") -> dict:
+    """Evaluate game using OpenAI GPT."""
+    return parse_json_response(ask_openai(build_prompt(game), api_key, model))
+
+
+def rate_limit_backoff(attempt: int, retry_after: str = None) -> float:
+    """Seconds to wait before retrying after the given (0-based) failed attempt.
 
+    retry_after is the response's retry-after header, if any; when it holds a
+    number of seconds, that is the wait.
+    """
     try:
-        if "```json" in response_text:
-            json_str = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            json_str = response_text.split("```")[1].split("```")[0]
+        return max(float(retry_after), 0.0)
+    except (TypeError, ValueError):
+        return min(RATE_LIMIT_INITIAL_BACKOFF * 2 ** attempt + random.random(), RATE_LIMIT_MAX_BACKOFF)
+
+
+def is_retryable(error: Exception) -> bool:
+    """True for API errors worth retrying: rate limits and transient failures."""
+    if isinstance(error, anthropic.APIConnectionError):
+        return True
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+async def evaluate_with_anthropic_async(games: list, api_key: str, model: str = "claude-sonnet-4-20250514",
+                                        concurrency: int = DEFAULT_CONCURRENCY, qpm: int = None) -> list:
+    """Evaluate games concurrently, one request per game.
+
+    All requests share one AsyncAnthropic client (and so one connection
+    pool); the semaphore caps how many are in flight at once. With qpm set,
+    request starts (retries included) are spaced so no more than qpm begin
+    per minute. Requests rejected with a rate limit error, or failing with a
+    connection error, timeout or server error, are retried with backoff, and
+    the number of rate limit rejections is reported at the end. The SDK's
+    own retries are turned off, so this loop owns every retry. A game whose
+    request fails gets a parse_error entry instead of failing the whole run.
+    """
+    if not HAS_ANTHROPIC:
+        raise ImportError("anthropic package not installed. Run: pip install anthropic")
+
+    client = anthropic.AsyncAnthropic(
+        api_key=api_key,
+        max_retries=0,
+        http_client=anthropic.DefaultAsyncHttpxClient(**http_client_options(anthropic))
+    )
+    semaphore = asyncio.Semaphore(concurrency)
+    interval = 60.0 / qpm if qpm else 0.0
+    next_start = 0.0
+    rate_limited = 0
+
+    async def _throttle():
+        # Reserve the next start slot, then sleep until it comes round
+        nonlocal next_start
+        now = time.monotonic()
+        start = max(now, next_start)
+        next_start = start + interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def _one(game: dict) -> dict:
+        nonlocal rate_limited
+        prompt = build_prompt(game)
+        async with semaphore:
+            for attempt in range(RATE_LIMIT_ATTEMPTS):
+                await _throttle()
+                try:
+                    response = await client.messages.create(
+                        model=model,
+                        max_tokens=MAX_TOKENS_PER_GAME,
+                        messages=[{"role": "user", "content": prompt}]
+                    )
+                    break
+                except anthropic.APIError as e:
+                    if isinstance(e, anthropic.RateLimitError):
+                        rate_limited += 1
+                    if not is_retryable(e) or attempt == RATE_LIMIT_ATTEMPTS - 1:
+                        raise
+                    response = getattr(e, "response", None)
+                    retry_after = response.headers.get("retry-after") if response is not None else None
+                    await asyncio.sleep(rate_limit_backoff(attempt, retry_after))
+        return parse_json_response(response.content[0].text)
+
+    try:
+        results = await asyncio.gather(*(_one(game) for game in games), return_exceptions=True)
+    finally:
+        await client.close()
+        if rate_limited:
+            print(f"Rate limited (HTTP 429) {rate_limited} time(s); lower --concurrency or set --qpm.")
+
+    return [
+        {"parse_error": True, "raw_response": f"request failed: {result!r}"}
+        if isinstance(result, Exception) else result
+        for result in results
+    ]
+
+
+def order_batch_evaluations(evaluations, count: int):
+    """Match a combined response to its games.
+
+    Returns count evaluation dicts in game order, ordered by their "game"
+    field when every entry has one, or None if the response doesn't fit.
+    """
+    if not isinstance(evaluations, list) or len(evaluations) != count:
+        return None
+    if not all(isinstance(evaluation, dict) for evaluation in evaluations):
+        return None
+
+    numbers = [evaluation.get("game") for evaluation in evaluations]
+    if all(number is None for number in numbers):
+        return evaluations
+    if set(numbers) != set(range(1, count + 1)):
+        return None
+    return sorted(evaluations, key=lambda evaluation: evaluation["game"])
+
+
+def evaluate_games_batch(games: list, api_key: str, model: str, provider: str = "anthropic") -> list:
+    """Evaluate several games with a single request.
+
+    Returns one evaluation per game, in order. If the response is not a JSON
+    array of one evaluation object per game, every game gets the parse error.
+    """
+    prompt = build_batch_prompt(games)
+    max_tokens = min(MAX_TOKENS_PER_GAME * len(games), MAX_BATCH_TOKENS)
+
+    if provider == "anthropic":
+        response_text = ask_anthropic(prompt, api_key, model, max_tokens)
+    else:
+        response_text = ask_openai(prompt, api_key, model, max_tokens)
+
+    evaluations = order_batch_evaluations(parse_json_response(response_text), len(games))
+    if evaluations is not None:
+        return evaluations
+    return [{"raw_response": response_text, "parse_error": True} for _ in games]
+
+
+def evaluate_with_anthropic_batch_api(games: list, api_key: str, model: str) -> list:
+    """Evaluate games through the Anthropic Message Batches API.
+
+    Each game is its own request inside one batch job, billed at the batch
+    discount. Blocks until the job has ended, printing progress, and raises
+    TimeoutError if it hasn't ended within BATCH_TIMEOUT.
+    """
+    client = get_anthropic_client(api_key)
+
+    batch = client.messages.batches.create(requests=[
+        {
+            "custom_id": f"game-{i}",
+            "params": {
+                "model": model,
+                "max_tokens": MAX_TOKENS_PER_GAME,
+                "messages": [{"role": "user", "content": build_prompt(game)}],
+            },
+        }
+        for i, game in enumerate(games)
+    ])
+
+    deadline = time.monotonic() + BATCH_TIMEOUT
+    while batch.processing_status != "ended":
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Batch {batch.id} did not end within {BATCH_TIMEOUT}s")
+        time.sleep(BATCH_POLL_INTERVAL)
+        batch = client.messages.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        print(f"Batch {batch.id}: {len(games) - counts.processing}/{len(games)} requests done")
+
+    evaluations = [{"parse_error": True, "raw_response": "missing from batch results"} for _ in games]
+    for entry in client.messages.batches.results(batch.id):
+        index = int(entry.custom_id.split("-", 1)[1])
+        if entry.result.type == "succeeded":
+            evaluations[index] = parse_json_response(entry.result.message.content[0].text)
         else:
-            json_str = response_text
+            evaluations[index] = {"parse_error": True, "raw_response": f"batch request {entry.result.type}"}
+    return evaluations
 
-        return json.loads(json_str)
-    except json.JSONDecodeError:
-        return {"raw_response": response_text, "parse_error": True}
+
+def print_move_progress(evaluation: dict, shown: int) -> int:
+    """Print move analyses that arrived since the last call.
+
+    Returns the number of moves printed so far.
+    """
+    moves = evaluation.get('moves') or []
+    if not isinstance(moves, list):
+        return shown
+    for move in moves[shown:]:
+        if isinstance(move, dict):
+            print(f"  Move {move.get('move')}: {move.get('player')} at {move.get('position')} "
+                  f"(rating: {move.get('rating')}) {move.get('comment', '')}")
+    return max(shown, len(moves))
 
 
 def print_evaluation(evaluation: dict):
@@ -247,24 +755,125 @@ def print_evaluation(evaluation: dict):
     print("\n" + "=" * 60)
 
 
+def request_chunks(games: list, args) -> list:
+    """Split games into the groups sent together in one combined request."""
+    if args.batch_api or args.batch_size == 1:
+        return [[game] for game in games]
+    return [games[start:start + args.batch_size] for start in range(0, len(games), args.batch_size)]
+
+
+def evaluate_games(games: list, api_key: str, args) -> list:
+    """Evaluate a list of games, answering from the cache where possible."""
+    if args.no_cache:
+        return request_evaluations(games, api_key, args)
+
+    # Combined requests use a different prompt and a smaller per-game budget,
+    # so their results are kept apart from single-game evaluations. A game
+    # sent on its own (a trailing chunk of one, or a single --game) gets the
+    # single-game prompt and is stored under its key, so look there too.
+    batching = args.batch_size > 1 and not args.batch_api
+    evaluations = []
+    for game in games:
+        evaluation = cache_get(batch_cache_key(args.provider, args.model, game)) if batching else None
+        if evaluation is None:
+            evaluation = cache_get(cache_key(args.provider, args.model, build_prompt(game)))
+        evaluations.append(evaluation)
+
+    pending = [i for i, evaluation in enumerate(evaluations) if evaluation is None]
+    if pending:
+        todo = [games[i] for i in pending]
+        fresh = request_evaluations(todo, api_key, args)
+        combined = [len(chunk) > 1 for chunk in request_chunks(todo, args) for _ in chunk]
+        for i, evaluation, was_combined in zip(pending, fresh, combined):
+            evaluations[i] = evaluation
+            if was_combined:
+                cache_put(batch_cache_key(args.provider, args.model, games[i]), evaluation)
+            else:
+                cache_put(cache_key(args.provider, args.model, build_prompt(games[i])), evaluation)
+    return evaluations
+
+
+def request_evaluations(games: list, api_key: str, args) -> list:
+    """Evaluate a list of games, batching requests as requested on the command line."""
+    if args.batch_api:
+        return evaluate_with_anthropic_batch_api(games, api_key, args.model)
+
+    if args.batch_size == 1 and len(games) > 1 and args.provider == "anthropic":
+        return asyncio.run(evaluate_with_anthropic_async(games, api_key, args.model,
+                                                         args.concurrency, args.qpm))
+
+    evaluations = []
+    for chunk in request_chunks(games, args):
+        if len(chunk) > 1:
+            evaluations.extend(evaluate_games_batch(chunk, api_key, args.model, args.provider))
+        elif args.provider == "anthropic":
+            evaluations.append(evaluate_with_anthropic(chunk[0], api_key, args.model))
+        else:
+            evaluations.append(evaluate_with_openai(chunk[0], api_key, args.model))
+    return evaluations
+
+
 def main():
     parser = argparse.ArgumentParser(description="Evaluate Gomoku games using LLM")
-    parser.add_argument("--game", "-g", required=True, help="Path to game JSON file")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--game", "-g", help="Path to game JSON file")
+    source.add_argument("--games-glob", help="Glob pattern matching several game JSON files")
+    source.add_argument("--games-dir", help="Directory of game JSON files to evaluate")
     parser.add_argument("--api-key", "-k", help="API key (or set ANTHROPIC_API_KEY/OPENAI_API_KEY env var)")
     parser.add_argument("--model", "-m", default="claude-sonnet-4-20250514",
                         help="Model to use (default: claude-sonnet-4-20250514)")
     parser.add_argument("--provider", "-p", choices=["anthropic", "openai"], default="anthropic",
                         help="API provider (default: anthropic)")
+    parser.add_argument("--batch-size", "-b", type=int, default=1,
+                        help=f"Games to evaluate per request, at most {MAX_BATCH_SIZE} (default: 1)")
+    parser.add_argument("--batch-api", action="store_true",
+                        help="Use the Anthropic Message Batches API (slower, cheaper)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Max requests in flight when evaluating many games (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--qpm", type=int,
+                        help="Max requests started per minute when evaluating many games (default: no limit)")
+    parser.add_argument("--stream", "-s", action="store_true",
+                        help="Stream the evaluation, printing each move analysis as it arrives")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore cached evaluations and always call the API")
     parser.add_argument("--output", "-o", help="Save evaluation to JSON file")
 
     args = parser.parse_args()
 
-    # Load game
-    if not Path(args.game).exists():
-        print(f"Error: Game file not found: {args.game}")
-        sys.exit(1)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.batch_size > MAX_BATCH_SIZE:
+        parser.error(f"--batch-size must be at most {MAX_BATCH_SIZE} "
+                     f"({MAX_TOKENS_PER_GAME} output tokens per game, {MAX_BATCH_TOKENS} per request)")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.qpm is not None and args.qpm < 1:
+        parser.error("--qpm must be at least 1")
+    if args.batch_api and args.provider != "anthropic":
+        parser.error("--batch-api is only supported with --provider anthropic")
+    if args.stream and (not args.game or args.provider != "anthropic"):
+        parser.error("--stream is only supported for a single --game with --provider anthropic")
+
+    # Load games
+    if args.game:
+        paths = [args.game]
+    elif args.games_dir:
+        paths = sorted(str(path) for path in Path(args.games_dir).glob("*.json"))
+        if not paths:
+            print(f"Error: No game files found in: {args.games_dir}")
+            sys.exit(1)
+    else:
+        paths = sorted(glob.glob(args.games_glob))
+        if not paths:
+            print(f"Error: No game files match: {args.games_glob}")
+            sys.exit(1)
+
+    for path in paths:
+        if not Path(path).exists():
+            print(f"Error: Game file not found: {path}")
+            sys.exit(1)
 
-    game = load_game(args.game)
+    games = [load_game(path) for path in paths]
 
     # Get API key
     import os
@@ -280,20 +889,35 @@ def main():
         sys.exit(1)
 
     # Evaluate
-    print(f"Evaluating game using {args.provider} ({args.model})...")
-
-    if args.provider == "anthropic":
-        evaluation = evaluate_with_anthropic(game, api_key, args.model)
+    if len(games) == 1:
+        print(f"Evaluating game using {args.provider} ({args.model})...")
+    else:
+        print(f"Evaluating {len(games)} games using {args.provider} ({args.model})...")
+
+    if args.stream:
+        shown = 0
+        evaluation = {}
+        stream = stream_evaluation_with_anthropic(games[0], api_key, args.model, use_cache=not args.no_cache)
+        for evaluation in stream:
+            shown = print_move_progress(evaluation, shown)
+        evaluations = [evaluation]
     else:
-        evaluation = evaluate_with_openai(game, api_key, args.model)
+        evaluations = evaluate_games(games, api_key, args)
 
     # Print results
-    print_evaluation(evaluation)
+    for path, evaluation in zip(paths, evaluations):
+        if len(paths) > 1:
+            print(f"\n{path}")
+        print_evaluation(evaluation)
 
     # Save if requested
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(evaluation, f, indent=2)
+        if args.game:
+            result = evaluations[0]
+        else:
+            result = dict(zip(paths, evaluations))
+        with open(args.output, 'wb') as f:
+            f.write(json_dumps(result, indent=True))
         print(f"\nEvaluation saved to: {args.output}")
 
 
@@ -0,0 +1,233 @@
+"""Tests for llm_eval."""
+
+import argparse
+import asyncio
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import llm_eval
+
+GAME = {"moves": [{"X (AI)": "H8"}], "winner": "X"}
+
+RATE_LIMITED = (429, {"type": "error", "error": {"type": "rate_limit_error", "message": "slow down"}},
+                {"retry-after": "7"})
+OVERLOADED = (529, {"type": "error", "error": {"type": "overloaded_error", "message": "busy"}})
+SERVER_ERROR = (500, {"type": "error", "error": {"type": "api_error", "message": "oops"}})
+BAD_REQUEST = (400, {"type": "error", "error": {"type": "invalid_request_error", "message": "no"}})
+
+
+def message(text: str) -> tuple:
+    """A successful Messages API reply carrying text."""
+    return (200, {"id": "msg", "type": "message", "role": "assistant", "model": "test-model",
+                  "content": [{"type": "text", "text": text}], "stop_reason": "end_turn",
+                  "usage": {"input_tokens": 1, "output_tokens": 1}})
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers each request with respond(request body), recording the bodies.
+
+    respond returns (status, payload) or (status, payload, extra headers).
+    """
+
+    requests = []
+    respond = staticmethod(lambda body: RATE_LIMITED)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode()
+        type(self).requests.append(body)
+        status, payload, *headers = type(self).respond(body)
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in (headers[0] if headers else {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Local Anthropic stand-in; set .respond to choose its replies."""
+    StubHandler.requests = []
+    StubHandler.respond = staticmethod(lambda body: RATE_LIMITED)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    StubHandler.waits = []
+    monkeypatch.setattr(llm_eval, "rate_limit_backoff",
+                        lambda attempt, retry_after=None: StubHandler.waits.append(retry_after) or 0)
+    yield StubHandler
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.skipif(not llm_eval.HAS_ANTHROPIC, reason="anthropic package not installed")
+def test_rate_limited_requests_are_retried_only_by_our_loop(stub_api, monkeypatch, capsys):
+    """Each attempt is exactly one HTTP request, and every 429 is reported."""
+    monkeypatch.setattr(llm_eval, "RATE_LIMIT_ATTEMPTS", 3)
+
+    [evaluation] = asyncio.run(llm_eval.evaluate_with_anthropic_async([GAME], "test-key", "test-model"))
+
+    assert evaluation["parse_error"]
+    assert "RateLimitError" in evaluation["raw_response"]
+    assert len(stub_api.requests) == 3
+    assert stub_api.waits == ["7", "7"]
+    assert "Rate limited (HTTP 429) 3 time(s)" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not llm_eval.HAS_ANTHROPIC, reason="anthropic package not installed")
+def test_transient_server_errors_are_retried(stub_api, capsys):
+    """Overloaded (529) and 5xx replies are retried, but not counted as 429s."""
+    replies = iter([OVERLOADED, SERVER_ERROR, message('{"overall_rating": 6}')])
+    stub_api.respond = staticmethod(lambda body: next(replies))
+
+    evaluations = asyncio.run(llm_eval.evaluate_with_anthropic_async([GAME], "test-key", "test-model"))
+
+    assert evaluations == [{"overall_rating": 6}]
+    assert len(stub_api.requests) == 3
+    assert "Rate limited" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("retry_after, expected", [("7", 7.0), ("0.5", 0.5), ("-3", 0.0)])
+def test_backoff_honours_retry_after(retry_after, expected):
+    assert llm_eval.rate_limit_backoff(5, retry_after) == expected
+
+
+@pytest.mark.parametrize("retry_after", [None, "Wed, 21 Oct 2026 07:28:00 GMT"])
+def test_backoff_without_usable_retry_after_is_exponential(retry_after):
+    assert 4.0 <= llm_eval.rate_limit_backoff(2, retry_after) < 5.0
+    assert llm_eval.rate_limit_backoff(10, retry_after) == llm_eval.RATE_LIMIT_MAX_BACKOFF
+
+
+@pytest.mark.skipif(not llm_eval.HAS_ANTHROPIC, reason="anthropic package not installed")
+def test_one_failed_game_keeps_the_other_evaluations(stub_api):
+    """A request that fails is recorded for its game; the rest still return."""
+    stub_api.respond = staticmethod(
+        lambda body: BAD_REQUEST if "FINAL RESULT: O" in body else message('{"overall_rating": 6}'))
+    games = [GAME, {**GAME, "winner": "O"}, GAME]
+
+    evaluations = asyncio.run(llm_eval.evaluate_with_anthropic_async(games, "test-key", "test-model"))
+
+    assert evaluations[0] == evaluations[2] == {"overall_rating": 6}
+    assert evaluations[1]["parse_error"]
+    assert "BadRequestError" in evaluations[1]["raw_response"]
+
+
+def test_batch_evaluations_are_ordered_by_game_number():
+    """Entries carrying a "game" field are put back in game order."""
+    evaluations = [{"game": 2, "overall_rating": 5}, {"game": 1, "overall_rating": 7}]
+    ordered = llm_eval.order_batch_evaluations(evaluations, 2)
+    assert [evaluation["game"] for evaluation in ordered] == [1, 2]
+
+
+@pytest.mark.parametrize("evaluations", [
+    {"overall_rating": 7},
+    [{"overall_rating": 7}],
+    [{"overall_rating": 7}, "not an evaluation"],
+    [{"game": 1}, {"game": 1}],
+    [{"game": 1}, {"overall_rating": 7}],
+])
+def test_batch_evaluations_that_dont_fit_are_rejected(evaluations):
+    """Wrong shape, length, element type or numbering yields None."""
+    assert llm_eval.order_batch_evaluations(evaluations, 2) is None
+
+
+MOVES = [
+    {"move_number": 1, "player": "X", "position": "H8", "rating": 7,
+     "comment": 'opens {center} with a "classic" start \\ no [brackets] closed }'},
+    {"move_number": 2, "player": "O", "position": "I9", "rating": 5,
+     "threats": {"open_threes": ["G7", "F6"], "blocked": {"fours": []}},
+     "comment": "escaped quote \" then }{ braces"},
+]
+EVALUATION = {"summary": "moves: [ {not a move} ]", "moves": MOVES, "overall_rating": 6,
+              "notes": [{"moves": "ignored"}]}
+
+
+def feed_in_chunks(text: str, rng: random.Random) -> llm_eval.MoveStreamParser:
+    parser = llm_eval.MoveStreamParser()
+    i = 0
+    while i < len(text):
+        step = rng.randint(1, 7)
+        parser.feed(text[i:i + step])
+        i += step
+    return parser
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_stream_parser_survives_any_chunking(seed):
+    """Moves come out whole however the response is split across events."""
+    parser = feed_in_chunks(json.dumps(EVALUATION, indent=2), random.Random(seed))
+    assert parser.moves == MOVES
+
+
+def test_stream_parser_reports_each_completed_move():
+    """feed() is True exactly for the chunk that closes a move."""
+    text = json.dumps(EVALUATION)
+    parser = llm_eval.MoveStreamParser()
+    completed = [i for i, ch in enumerate(text) if parser.feed(ch)]
+    assert len(completed) == len(MOVES)
+    assert all(text[i] == "}" for i in completed)
+
+
+def test_stream_parser_reads_a_fenced_reply():
+    """A reply wrapped in prose and a json fence still yields its moves."""
+    text = f"Here is my analysis:\n\n```json\n{json.dumps(EVALUATION, indent=2)}\n```\nHope this helps!"
+    assert feed_in_chunks(text, random.Random(0)).moves == MOVES
+
+
+def test_cache_keys_follow_the_prompt_each_game_was_sent_with(tmp_path, monkeypatch):
+    """A trailing chunk of one is a single-game request and is cached as one."""
+    monkeypatch.setattr(llm_eval, "CACHE_DIR", tmp_path)
+    sent = []
+    monkeypatch.setattr(llm_eval, "evaluate_games_batch",
+                        lambda chunk, *rest: sent.append(len(chunk)) or [{"combined": True} for _ in chunk])
+    monkeypatch.setattr(llm_eval, "evaluate_with_anthropic",
+                        lambda game, *rest: sent.append(1) or {"combined": False})
+    games = [{**GAME, "winner": winner} for winner in ("X", "O", "draw")]
+    args = argparse.Namespace(no_cache=False, batch_api=False, batch_size=2, provider="anthropic",
+                              model="test-model", concurrency=1, qpm=None)
+
+    first = llm_eval.evaluate_games(games, "test-key", args)
+
+    assert sent == [2, 1]
+    assert first == [{"combined": True}, {"combined": True}, {"combined": False}]
+    assert llm_eval.cache_get(llm_eval.batch_cache_key("anthropic", "test-model", games[0]))
+    assert llm_eval.cache_get(llm_eval.cache_key("anthropic", "test-model", llm_eval.build_prompt(games[2])))
+    assert llm_eval.evaluate_games(games, "test-key", args) == first
+    assert sent == [2, 1]
+
+
+@pytest.mark.parametrize("response", [
+    'Example:\n```python\nprint({"overall_rating": 1})\n```\nResult:\n```json\n{"overall_rating": 6}\n```',
+    'Result:\n```\n{"overall_rating": 6}\n```',
+    '{"overall_rating": 6}',
+    '  \n{"overall_rating": 6}\n',
+])
+def test_parse_json_response_finds_the_evaluation(response):
+    assert llm_eval.parse_json_response(response) == {"overall_rating": 6}
+
+
+def test_parse_json_response_reads_a_bare_array():
+    assert llm_eval.parse_json_response('[{"game": 1}, {"game": 2}]') == [{"game": 1}, {"game": 2}]
+
+
+def test_parse_json_response_reports_unparseable_text():
+    assert llm_eval.parse_json_response("no json here") == {"raw_response": "no json here", "parse_error": True}
+
+
+def test_cache_round_trips_non_ascii_text(tmp_path, monkeypatch):
+    """Cache files are UTF-8 whatever the locale's default encoding is."""
+    monkeypatch.setattr(llm_eval, "CACHE_DIR", tmp_path)
+    evaluation = {"summary": "Schöne Eröffnung — 天元 ✓"}
+    llm_eval.cache_put("key", evaluation)
+    assert llm_eval.cache_get("key") == evaluation
+    assert json.loads((tmp_path / "key.json").read_bytes().decode("utf-8")) == evaluation
@@ -31,10 +31,12 @@ module Eval
           desc: "Board size"
         option :timeout, aliases: ["t"], type: :integer, default: 300,
           desc: "Move timeout (seconds)"
+        option :parallel, aliases: ["p"], type: :integer, default: nil,
+          desc: "Max games to run concurrently (default: number of CPUs)"
         option :verbose, aliases: ["v"], type: :boolean, default: false,
           desc: "Verbose output"
 
-        def call(games:, depths:, radiuses:, board:, timeout:, verbose:, **)
+        def call(games:, depths:, radiuses:, board:, timeout:, verbose:, parallel: nil, **)
           script_dir = File.expand_path(File.dirname(__FILE__))
           root_dir = File.expand_path("../../../", script_dir)
           client_path = File.join(root_dir, "gomoku-http-client")
@@ -51,7 +53,7 @@ module Eval
 
           depth_arr = depths.split(",").map(&:strip).map(&:to_i)
           radius_arr = radiuses.split(",").map(&:strip).map(&:to_i)
-          num_workers = [Parallel.processor_count, 1].max
+          num_workers = [(parallel || Parallel.processor_count).to_i, 1].max
 
           pids = []
           runner = TournamentRunner.new(
@@ -77,7 +79,9 @@ module Eval
           trap("INT") do
             runner.interrupted = true
             EvalOutput.warn("Interrupted. Saving state and killing client processes...")
-            pids_to_kill = runner.pids_mutex.synchronize { runner.pids.dup }
+            # Mutex#synchronize raises ThreadError in trap context; Array#dup is
+            # atomic under the GVL, so a plain copy is safe here.
+            pids_to_kill = runner.pids.dup
             pids_to_kill.each do |pid|
               Process.kill(9, pid) rescue nil
             end
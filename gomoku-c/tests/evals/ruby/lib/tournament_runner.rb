@@ -15,6 +15,8 @@ class TournamentRunner
   DEFAULT_BOARD = 15
   DEFAULT_TIMEOUT = 300
   HTTP_PORT = 10_000
+  # "winner" is the first top-level key the client writes, so we can stop reading there.
+  WINNER_PATTERN = /"winner"\s*:\s*"([^"]*)"/
 
   Result = Struct.new(:radius, :depth_x, :depth_o, :winner, :time_sec, :game_index, :client_exitstatus, keyword_init: true) do
     def header
@@ -49,7 +51,7 @@ class TournamentRunner
     @radiuses = radiuses.to_a.map(&:to_i)
     @board_size = board_size.to_i
     @timeout = timeout.to_i
-    @num_workers = num_workers.to_i || [Parallel.processor_count, 1].max
+    @num_workers = [(num_workers || Parallel.processor_count).to_i, 1].max
     @pids = pids.to_a || []
     @pids_mutex = Mutex.new
     @on_progress = on_progress
@@ -85,9 +87,11 @@ class TournamentRunner
     collected = []
     mutex = Mutex.new
 
-    # Use threads so spawn() PIDs are children of this process and can be killed on SIGINT
-    Parallel.each(jobs, in_processes: @num_workers) do |job|
-      break if @interrupted
+    # Use threads so spawn() PIDs are children of this process and can be killed on SIGINT.
+    # Each game is an external client process, so threads are enough to keep every core busy,
+    # and results land in +collected+ without having to be marshalled back from forked workers.
+    Parallel.each(jobs, in_threads: [@num_workers, jobs.size].min) do |job|
+      raise Parallel::Break if @interrupted
       result = run_one_game(
         radius: job[:radius],
         depth_x: job[:depth_x],
@@ -105,10 +109,6 @@ class TournamentRunner
   end
 
   def run_one_game(radius:, depth_x:, depth_o:, game_index:)
-    game_file = File.join(
-      @output_dir,
-      "game-r#{radius}-d#{depth_x}-d#{depth_o}-b#{@board_size}-#{game_index}.json"
-    )
     argv = [
       @client_path,
       "-p", HTTP_PORT.to_s,
@@ -117,24 +117,24 @@ class TournamentRunner
       "-b", @board_size.to_s,
       "-t", @timeout.to_s,
       "-q",
-      "-j", game_file
+      "-j", "-"
     ]
     elapsed = nil
+    # With -q and "-j -" the client prints nothing but the finished game on stdout,
+    # so the result comes back over a pipe instead of a temp file in output_dir.
+    reader, writer = IO.pipe
     start = Process.clock_gettime(Process::CLOCK_MONOTONIC)
-    pid = spawn(*argv, out: File::NULL, err: File::NULL)
+    # The client never reads stdin; detach it so games can't touch the terminal.
+    pid = spawn(*argv, in: File::NULL, out: writer, err: File::NULL)
+    writer.close
     @pids_mutex.synchronize { @pids << pid }
+    winner = read_winner(reader)
+    reader.read # drain the rest so the client never blocks on a full pipe
     Process.wait(pid)
     @pids_mutex.synchronize { @pids.delete(pid) }
     elapsed = Process.clock_gettime(Process::CLOCK_MONOTONIC) - start
     client_exitstatus = $?&.exitstatus
 
-    winner = nil
-    if File.file?(game_file)
-      data = JSON.parse(File.read(game_file))
-      winner = data["winner"]
-      File.delete(game_file)
-    end
-
     Result.new(
       radius: radius,
       depth_x: depth_x,
@@ -170,6 +170,18 @@ class TournamentRunner
         "Error: #{e.message}",
         "Result: #{result.to_h.to_json}")
     end
+  ensure
+    [reader, writer].each { |io| io.close if io && !io.closed? }
+  end
+
+  # Reads the game JSON line by line and returns as soon as the winner is seen,
+  # instead of parsing the whole transcript just to read one field.
+  def read_winner(io)
+    io.each_line do |line|
+      match = WINNER_PATTERN.match(line)
+      return match[1] if match
+    end
+    nil
   end
 
   def write_radius_results(radius, radius_results)
@@ -235,28 +247,28 @@ class TournamentRunner
     File.open(@results_file, "a") { |f| f.puts lines }
   end
 
+  # Tallies everything in one pass over +results+, since it is re-run on the
+  # full result list for both the interrupted and the final summary.
   def self.aggregate_summary(results)
-    total = results.size
-    wins_higher = results.count do |r|
-      r.winner && (r.winner == "X" && r.depth_x > r.depth_o || r.winner == "O" && r.depth_o > r.depth_x)
-    end
-    wins_lower = results.count do |r|
-      r.winner && (r.winner == "X" && r.depth_x < r.depth_o || r.winner == "O" && r.depth_o < r.depth_x)
-    end
-
-    by_radius = results.group_by(&:radius)
+    wins_higher = 0
+    wins_lower = 0
     per_radius = {}
-    by_radius.each do |radius, rs|
-      matchups = Hash.new { |h, k| h[k] = { wins: 0, total: 0 } }
-      rs.each do |r|
-        next unless r.winner && r.winner != "draw"
-        key = [r.depth_x, r.depth_o]
-        matchups[key][:total] += 1
-        matchups[key][:wins] += 1 if r.winner == "X"  # first player (depth_x) wins
+
+    results.each do |r|
+      matchups = per_radius[r.radius] ||= Hash.new { |h, k| h[k] = { wins: 0, total: 0 } }
+      next unless r.winner && r.winner != "draw"
+
+      if r.winner == "X" || r.winner == "O"
+        winner_depth, loser_depth = r.winner == "X" ? [r.depth_x, r.depth_o] : [r.depth_o, r.depth_x]
+        wins_higher += 1 if winner_depth > loser_depth
+        wins_lower += 1 if winner_depth < loser_depth
       end
-      per_radius[radius] = matchups
+
+      key = [r.depth_x, r.depth_o]
+      matchups[key][:total] += 1
+      matchups[key][:wins] += 1 if r.winner == "X"  # first player (depth_x) wins
     end
 
-    { total: total, wins_higher: wins_higher, wins_lower: wins_lower, per_radius: per_radius, results: results }
+    { total: results.size, wins_higher: wins_higher, wins_lower: wins_lower, per_radius: per_radius, results: results }
   end
 end
@@ -69,6 +69,27 @@ RSpec.describe "depth_tournament_http CLI" do
     expect(runner).to have_received(:run)
   end
 
+  it "caps concurrent games with --parallel" do
+    script_dir = File.expand_path("..", __dir__)
+    root_dir = File.expand_path("../..", script_dir)
+    client_path = File.join(root_dir, "gomoku-http-client")
+    allow(File).to receive(:executable?).with(client_path).and_return(true)
+    allow(File).to receive(:write)
+    runner = instance_double(TournamentRunner,
+      run: nil,
+      results: [],
+      pids: [],
+      pids_mutex: Mutex.new,
+      interrupted: false)
+    allow(TournamentRunner).to receive(:new).and_return(runner)
+
+    Eval::CLI::Commands::Tournament.new.call(
+      games: 1, depths: "2,3", radiuses: "3", board: 15, timeout: 300, verbose: false, parallel: 2
+    )
+
+    expect(TournamentRunner).to have_received(:new).with(hash_including(num_workers: 2))
+  end
+
   describe "Tournament private helpers" do
     it "dump_partial_results writes to file when runner has results" do
       result_struct = TournamentRunner::Result
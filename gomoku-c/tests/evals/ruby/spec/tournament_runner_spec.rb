@@ -4,6 +4,7 @@ require "spec_helper"
 require "tournament_runner"
 require "fileutils"
 require "tempfile"
+require "stringio"
 
 RSpec.describe TournamentRunner do
   let(:client_path) { "/fake/gomoku-http-client" }
@@ -87,6 +88,39 @@ RSpec.describe TournamentRunner do
     end
   end
 
+  describe "#run_radius" do
+    it "collects every game result in the calling process" do
+      runner = described_class.new(
+        client_path: client_path,
+        output_dir: output_dir,
+        results_file: results_file,
+        games_per_matchup: 2,
+        depths: [2, 3],
+        radiuses: [3],
+        num_workers: 4
+      )
+      allow(runner).to receive(:run_one_game) do |radius:, depth_x:, depth_o:, game_index:|
+        result_struct.new(radius: radius, depth_x: depth_x, depth_o: depth_o, winner: "X",
+          time_sec: 0, game_index: game_index, client_exitstatus: 0)
+      end
+
+      collected = runner.run_radius(3, [[2, 3], [3, 2]])
+
+      expect(collected.size).to eq 4
+      expect(runner.results.size).to eq 4
+    end
+
+    it "defaults to at least one worker when num_workers is nil" do
+      runner = described_class.new(
+        client_path: client_path,
+        output_dir: output_dir,
+        results_file: results_file,
+        num_workers: nil
+      )
+      expect(runner.instance_variable_get(:@num_workers)).to be >= 1
+    end
+  end
+
   describe "#run_one_game" do
     let(:runner) do
       described_class.new(
@@ -101,13 +135,13 @@ RSpec.describe TournamentRunner do
       )
     end
 
-    it "parses winner from JSON and returns Result" do
+    it "parses winner from the client's stdout and returns Result" do
       fake_pid = 99_999
-      allow(runner).to receive(:spawn).and_return(fake_pid)
+      allow(runner).to receive(:spawn) do |*_argv, out:, **|
+        out.write("{\n  \"winner\":\"X\",\n  \"moves\":[]\n}\n")
+        fake_pid
+      end
       allow(Process).to receive(:wait).with(fake_pid)
-      allow(File).to receive(:file?).with(anything).and_return(true)
-      allow(File).to receive(:read).with(anything) { '{"winner":"X"}' }
-      allow(File).to receive(:delete)
 
       result = runner.run_one_game(radius: 3, depth_x: 2, depth_o: 3, game_index: 1)
 
@@ -118,11 +152,22 @@ RSpec.describe TournamentRunner do
       expect(result.winner).to eq "X"
     end
 
-    it "returns result with nil winner when JSON file missing" do
+    it "asks the client to write the game JSON to stdout, with stdin detached" do
+      fake_pid = 77_777
+      allow(runner).to receive(:spawn).and_return(fake_pid)
+      allow(Process).to receive(:wait).with(fake_pid)
+
+      runner.run_one_game(radius: 3, depth_x: 2, depth_o: 3, game_index: 1)
+
+      expect(runner).to have_received(:spawn).with(
+        client_path, *Array.new(11, anything), "-j", "-", hash_including(:out, in: File::NULL)
+      )
+    end
+
+    it "returns result with nil winner when the client writes no JSON" do
       fake_pid = 88_888
       allow(runner).to receive(:spawn).and_return(fake_pid)
       allow(Process).to receive(:wait).with(fake_pid)
-      allow(File).to receive(:file?).with(anything).and_return(false)
 
       result = runner.run_one_game(radius: 3, depth_x: 2, depth_o: 3, game_index: 1)
 
@@ -130,6 +175,35 @@ RSpec.describe TournamentRunner do
     end
   end
 
+  describe "#read_winner" do
+    let(:runner) do
+      described_class.new(
+        client_path: client_path,
+        output_dir: output_dir,
+        results_file: results_file,
+        num_workers: 1
+      )
+    end
+
+    it "returns the top-level winner without reading the moves" do
+      io = StringIO.new(<<~JSON)
+        {
+          "board_size":15,
+          "winner":"O",
+          "moves":[
+            { "X (AI)":"H8", "winner":true }
+          ]
+        }
+      JSON
+      expect(runner.read_winner(io)).to eq "O"
+      expect(io.eof?).to be false
+    end
+
+    it "returns nil when the output has no winner" do
+      expect(runner.read_winner(StringIO.new("{}\n"))).to be_nil
+    end
+  end
+
   describe "#write_radius_results" do
     let(:runner) do
       described_class.new(
@@ -1,53 +1,77 @@
 
+import asyncio
+import functools
 import json
 import time
 import subprocess
 import sys
 import os
+import socket
 import http.client
 import urllib.parse
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PORT = 8999
-SERVER_URL = f"http://localhost:{PORT}/gomoku/play"
 
-def start_server():
-    print(f"Starting server on port {PORT}...")
+def server_url(port):
+    return f"http://localhost:{port}/gomoku/play"
+
+def start_server(port=PORT):
+    print(f"Starting server on port {port}...")
     server_process = subprocess.Popen(
-        ["./gomoku-httpd", "-b", str(PORT)],
+        ["./gomoku-httpd", "-b", str(port)],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE
     )
-    time.sleep(1)  # Wait for server to start
-    # Check if process is still running
-    if server_process.poll() is not None:
-        stdout, stderr = server_process.communicate()
-        print(f"Server failed to start. Stdout: {stdout}\nStderr: {stderr}")
-        sys.exit(1)
-    return server_process
+    # Wait for the server to accept connections: poll every 20ms, up to 5s
+    for _ in range(250):
+        # Check if process is still running
+        if server_process.poll() is not None:
+            stdout, stderr = server_process.communicate()
+            print(f"Server failed to start. Stdout: {stdout}\nStderr: {stderr}")
+            sys.exit(1)
+        try:
+            socket.create_connection(("localhost", port), timeout=0.1).close()
+            return server_process
+        except OSError:
+            time.sleep(0.02)
+    server_process.terminate()
+    server_process.wait()
+    print(f"Server did not start listening on port {port} within 5s.")
+    sys.exit(1)
 
 def stop_server(process):
     print("Stopping server...")
     process.terminate()
     process.wait()
 
-def send_request(url, data, timeout=None):
+def open_conn(url):
     parsed = urlparse(url)
-    conn = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=timeout)
+    return http.client.HTTPConnection(parsed.hostname, parsed.port)
+
+# conn is kept open between calls (HTTP/1.1 keep-alive); timeout applies to
+# this request only, whether or not the socket is already connected.
+def send_request(conn, path, data, timeout=None):
     headers = {'Content-type': 'application/json'}
-    json_data = json.dumps(data)
-    
-    try:
-        conn.request("POST", parsed.path, json_data, headers)
-        response = conn.getresponse()
-        resp_data = response.read().decode()
-        return response.status, resp_data
-    except Exception as e:
-        raise e
-    finally:
-        conn.close()
+    json_data = orjson.dumps(data) if orjson else json.dumps(data)
+
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    conn.request("POST", path, json_data, headers)
+    response = conn.getresponse()
+    # Read the body fully so the connection is ready for the next request
+    resp_data = response.read().decode()
+    return response.status, resp_data
 
-def verify_timeout():
+# Built once and shared; callers must not mutate the returned dict.
+@functools.cache
+def build_payload():
     # Construct a valid board state with no winner
     moves = []
     # Place stones in a way that doesn't connect 5
@@ -67,70 +91,97 @@ def verify_timeout():
     
     # Now it is O's turn.
                  
-    payload_base = {
+    return {
         "board_size": 19,
         "X": {"player": "human", "time_ms": 0},
         "O": {"player": "AI", "depth": 10}, # Max depth
         "moves": moves
     }
 
+# Each test returns its report lines instead of printing, so tests running
+# concurrently don't interleave their output.
+def check_explicit_timeout(conn, path, payload_base):
     # Test 1: Explicit small timeout
-    print("\n--- Test 1: Explicit Timeout (1s) ---")
-    payload_timeout = payload_base.copy()
-    payload_timeout["timeout"] = 1 # 1 second
+    out = ["\n--- Test 1: Explicit Timeout (1s) ---"]
+    payload_timeout = {**payload_base, "timeout": 1} # 1 second
     
     start_time = time.time()
     try:
-        status, resp_data = send_request(SERVER_URL, payload_timeout)
+        status, resp_data = send_request(conn, path, payload_timeout)
         duration = time.time() - start_time
-        print(f"Request duration: {duration:.2f}s")
+        out.append(f"Request duration: {duration:.2f}s")
         
         if status == 200:
             if duration < 1.5: 
-                print("PASS: Returned quickly.")
+                out.append("PASS: Returned quickly.")
             else:
-                print("FAIL: Took too long.")
+                out.append("FAIL: Took too long.")
         else:
-            print(f"FAIL: Server returned {status}")
-            print(resp_data)
+            out.append(f"FAIL: Server returned {status}")
+            out.append(resp_data)
 
     except Exception as e:
-        print(f"FAIL: Request failed: {e}")
+        out.append(f"FAIL: Request failed: {e}")
+    return out
 
+def check_no_timeout(conn, path, payload_base):
     # Test 2: No Timeout
-    print("\n--- Test 2: No Timeout (Default) ---")
-    payload_no_timeout = payload_base.copy()
-    if "timeout" in payload_no_timeout:
-        del payload_no_timeout["timeout"]
+    out = ["\n--- Test 2: No Timeout (Default) ---"]
     
     start_time = time.time()
     try:
-        print("Sending request with NO timeout...")
+        out.append("Sending request with NO timeout...")
         # We assume with depth 10 (actually 12) it will take time.
-        status, resp_data = send_request(SERVER_URL, payload_no_timeout, timeout=10)
+        status, resp_data = send_request(conn, path, payload_base, timeout=10)
         duration = time.time() - start_time
-        print(f"Request duration: {duration:.2f}s")
+        out.append(f"Request duration: {duration:.2f}s")
         
         if status == 200:
             if duration > 1.1:
-                print("PASS: Calculation took > 1s")
+                out.append("PASS: Calculation took > 1s")
             else:
-                 print(f"INCONCLUSIVE: Too fast ({duration}s).")
-                 # print(f"Response: {resp_data}")
+                 out.append(f"INCONCLUSIVE: Too fast ({duration}s).")
         else:
-             print(f"FAIL: Server returned {status}")
-             print(resp_data)
+             out.append(f"FAIL: Server returned {status}")
+             out.append(resp_data)
 
     except Exception as e:
-        print(f"FAIL: Request failed: {e}")
+        out.append(f"FAIL: Request failed: {e}")
+    return out
+
+TESTS = [check_explicit_timeout, check_no_timeout]
+
+async def verify_timeout():
+    payload_base = build_payload()
+
+    # gomoku-httpd serves one request at a time, so concurrent tests against a
+    # single server would queue behind each other and skew every duration.
+    # Give each test its own server and run them side by side instead: total
+    # wall-clock is bounded by the slowest test rather than the sum. Each test
+    # gets one connection to its server, which carries all of its requests.
+    servers = []
+    conns = []
+    try:
+        for i in range(len(TESTS)):
+            servers.append(start_server(PORT + i))
+            conns.append(open_conn(server_url(PORT + i)))
+        path = urlparse(server_url(PORT)).path
+        reports = await asyncio.gather(*(
+            asyncio.to_thread(test, conn, path, payload_base)
+            for test, conn in zip(TESTS, conns)
+        ))
+    finally:
+        for conn in conns:
+            conn.close()
+        for server_process in servers:
+            stop_server(server_process)
+
+    for out in reports:
+        print("\n".join(out))
 
 if __name__ == "__main__":
     if not os.path.exists("./gomoku-httpd"):
         print("Error: gomoku-httpd binary not found.")
         sys.exit(1)
         
-    server_process = start_server()
-    try:
-        verify_timeout()
-    finally:
-        stop_server(server_process)
+    asyncio.run(verify_timeout())